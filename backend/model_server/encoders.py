@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import json
 import time
 from types import TracebackType
@@ -59,6 +60,14 @@ _RETRY_TRIES = 10 if INDEXING_ONLY else 2
 
 # OpenAI only allows 2048 embeddings to be computed at once
 _OPENAI_MAX_INPUT_LEN = 2048
+# Max number of OpenAI embedding batches in flight at once for a single embed
+# request. This is a per request bound, concurrent embed requests each get their own
+# limit and overall rate limiting is left to the OpenAI client's retries
+_OPENAI_MAX_CONCURRENT_BATCHES_PER_REQUEST = 8
+# Retries (with backoff) done by the OpenAI client on 429s / 5xxs. Indexing sends
+# many concurrent batches so it is more likely to hit rate limits and can afford
+# to wait, queries should fail fast
+_OPENAI_MAX_RETRIES = 6 if INDEXING_ONLY else 2
 # Cohere allows up to 96 embeddings in a single embedding calling
 _COHERE_MAX_INPUT_LEN = 96
 
@@ -119,6 +128,18 @@ class AuthenticationError(Exception):
         super().__init__(f"{provider} authentication failed: {message}")
 
 
+@functools.lru_cache(maxsize=8)
+def _get_openai_client(api_key: str) -> openai.AsyncOpenAI:
+    """Clients are shared across requests so the underlying connection pool
+    (and its TLS sessions) is reused instead of being rebuilt per embed call."""
+    # Use the OpenAI specific timeout for this one
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        timeout=OPENAI_EMBEDDING_TIMEOUT,
+        max_retries=_OPENAI_MAX_RETRIES,
+    )
+
+
 class CloudEmbedding:
     def __init__(
         self,
@@ -143,23 +164,47 @@ class CloudEmbedding:
         if not model:
             model = DEFAULT_OPENAI_MODEL
 
-        # Use the OpenAI specific timeout for this one
-        client = openai.AsyncOpenAI(
-            api_key=self.api_key, timeout=OPENAI_EMBEDDING_TIMEOUT
-        )
+        client = _get_openai_client(self.api_key)
+
+        semaphore = asyncio.Semaphore(_OPENAI_MAX_CONCURRENT_BATCHES_PER_REQUEST)
+        # Each batch writes to its own disjoint slice, so the output is sized once
+        # and keeps the input order regardless of which batch finishes first
+        final_embeddings: list[Embedding | None] = [None] * len(texts)
+
+        async def _embed_batch(offset: int) -> None:
+            text_batch = texts[offset : offset + _OPENAI_MAX_INPUT_LEN]
+            async with semaphore:
+                response = await client.embeddings.create(
+                    input=text_batch,
+                    model=model,
+                    dimensions=reduced_dimension or openai.NOT_GIVEN,
+                )
+            # A short response would shrink the list on slice assignment and shift
+            # every later batch onto the wrong texts
+            if len(response.data) != len(text_batch):
+                raise ValueError(
+                    f"OpenAI returned {len(response.data)} embeddings "
+                    f"for a batch of {len(text_batch)} texts"
+                )
+            final_embeddings[offset : offset + len(text_batch)] = [
+                embedding.embedding for embedding in response.data
+            ]
 
-        final_embeddings: list[Embedding] = []
+        tasks = [
+            asyncio.create_task(_embed_batch(offset))
+            for offset in range(0, len(texts), _OPENAI_MAX_INPUT_LEN)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # gather does not cancel the other batches on failure, stop them so
+            # batches still waiting on the semaphore don't make doomed API calls
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
-        for text_batch in batch_list(texts, _OPENAI_MAX_INPUT_LEN):
-            response = await client.embeddings.create(
-                input=text_batch,
-                model=model,
-                dimensions=reduced_dimension or openai.NOT_GIVEN,
-            )
-            final_embeddings.extend(
-                [embedding.embedding for embedding in response.data]
-            )
-        return final_embeddings
+        return cast(list[Embedding], final_embeddings)
 
     async def _embed_cohere(
         self, texts: list[str], model: str | None, embedding_type: str
@@ -404,7 +449,7 @@ def get_local_reranking_model(
     return _RERANK_MODEL
 
 
-@simple_log_function_time()
+@simple_log_function_time(debug_only=True)
 async def embed_text(
     texts: list[str],
     text_type: EmbedTextType,
@@ -435,7 +480,7 @@ async def embed_text(
         total_chars += len(text)
 
     if provider_type is not None:
-        logger.info(
+        logger.debug(
             f"Embedding {len(texts)} texts with {total_chars} total characters with provider: {provider_type}"
         )
 
@@ -480,7 +525,7 @@ async def embed_text(
             f"elapsed={elapsed:.2f}"
         )
     elif model_name is not None:
-        logger.info(
+        logger.debug(
             f"Embedding {len(texts)} texts with {total_chars} total characters with local model: {model_name}"
         )
 
@@ -502,7 +547,7 @@ async def embed_text(
         ]
 
         elapsed = time.monotonic() - start
-        logger.info(
+        logger.debug(
             f"Successfully embedded {len(texts)} texts with {total_chars} total characters "
             f"with local model {model_name} in {elapsed:.2f}"
         )
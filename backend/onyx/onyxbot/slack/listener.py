@@ -34,7 +34,6 @@ from onyx.configs.constants import OnyxRedisLocks
 from onyx.configs.onyxbot_configs import DANSWER_BOT_REPHRASE_MESSAGE
 from onyx.configs.onyxbot_configs import DANSWER_BOT_RESPOND_EVERY_CHANNEL
 from onyx.configs.onyxbot_configs import NOTIFY_SLACKBOT_NO_ANSWER
-from onyx.connectors.slack.utils import expert_info_from_slack_id
 from onyx.context.search.retrieval.search_runner import (
     download_nltk_data,
 )
@@ -87,6 +86,7 @@ from onyx.onyxbot.slack.utils import check_message_limit
 from onyx.onyxbot.slack.utils import decompose_action_id
 from onyx.onyxbot.slack.utils import get_channel_name_from_id
 from onyx.onyxbot.slack.utils import get_onyx_bot_auth_ids
+from onyx.onyxbot.slack.utils import get_sender_expert_info
 from onyx.onyxbot.slack.utils import read_slack_thread
 from onyx.onyxbot.slack.utils import remove_onyx_bot_tag
 from onyx.onyxbot.slack.utils import rephrase_slack_message
@@ -835,8 +835,8 @@ def build_request_details(
         message_ts = event.get("ts")
         thread_ts = event.get("thread_ts")
         sender_id = event.get("user") or None
-        expert_info = expert_info_from_slack_id(
-            sender_id, client.web_client, user_cache={}
+        expert_info = get_sender_expert_info(
+            tenant_id, client.slack_bot_id, sender_id, client.web_client
         )
         email = expert_info.email if expert_info else None
 
@@ -906,8 +906,8 @@ def build_request_details(
         channel_name = req.payload["channel_name"]
         msg = req.payload["text"]
         sender = req.payload["user_id"]
-        expert_info = expert_info_from_slack_id(
-            sender, client.web_client, user_cache={}
+        expert_info = get_sender_expert_info(
+            tenant_id, client.slack_bot_id, sender, client.web_client
         )
         email = expert_info.email if expert_info else None
 
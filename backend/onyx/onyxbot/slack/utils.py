@@ -31,6 +31,8 @@ from onyx.configs.onyxbot_configs import (
 from onyx.configs.onyxbot_configs import (
     DANSWER_BOT_RESPONSE_LIMIT_TIME_PERIOD_SECONDS,
 )
+from onyx.connectors.models import BasicExpertInfo
+from onyx.connectors.slack.utils import expert_info_from_slack_id
 from onyx.connectors.slack.utils import SlackTextCleaner
 from onyx.db.engine.sql_engine import get_session_with_current_tenant
 from onyx.db.users import get_user_by_email
@@ -53,6 +55,15 @@ slack_token_user_ids: dict[str, str | None] = {}
 slack_token_bot_ids: dict[str, str | None] = {}
 slack_token_lock = threading.Lock()
 
+# Slack user profiles rarely change, so sender lookups are cached per Slack bot
+# (a tenant can run bots in several workspaces) and the whole cache is dropped
+# periodically to pick up renamed / deactivated users
+_SENDER_CACHE_TTL_SECONDS = 60 * 60
+_SENDER_CACHE_MAX_USERS_PER_BOT = 4096
+_sender_info_caches: dict[tuple[str, int], dict[str, BasicExpertInfo]] = {}
+_sender_info_cache_start_time: float = time.monotonic()
+_sender_info_lock = threading.Lock()
+
 _DANSWER_BOT_MESSAGE_COUNT: int = 0
 _DANSWER_BOT_COUNT_START_TIME: float = time.time()
 
@@ -83,6 +94,41 @@ def get_onyx_bot_auth_ids(
     return user_id, bot_id
 
 
+def get_sender_expert_info(
+    tenant_id: str, slack_bot_id: int, sender_id: str | None, web_client: WebClient
+) -> BasicExpertInfo | None:
+    """Resolves the sender of a Slack event, reusing previous users.info lookups
+    so repeat senders don't cost a Slack API round trip on every message."""
+    global _sender_info_cache_start_time
+
+    if not sender_id:
+        return None
+
+    cache_key = (tenant_id, slack_bot_id)
+    with _sender_info_lock:
+        if time.monotonic() - _sender_info_cache_start_time > _SENDER_CACHE_TTL_SECONDS:
+            _sender_info_caches.clear()
+            _sender_info_cache_start_time = time.monotonic()
+
+        cached_info = _sender_info_caches.get(cache_key, {}).get(sender_id)
+        if cached_info is not None:
+            return cached_info
+
+    # The Slack call is made outside of the lock, concurrent misses for the same
+    # user at worst result in a duplicate lookup
+    expert_info = expert_info_from_slack_id(sender_id, web_client, user_cache={})
+
+    # Failed lookups are not cached so they are retried on the next event
+    if expert_info is not None:
+        with _sender_info_lock:
+            user_cache = _sender_info_caches.setdefault(cache_key, {})
+            if len(user_cache) >= _SENDER_CACHE_MAX_USERS_PER_BOT:
+                user_cache.clear()
+            user_cache[sender_id] = expert_info
+
+    return expert_info
+
+
 def check_message_limit() -> bool:
     """
     This isnt a perfect solution.
@@ -11,6 +11,7 @@ import pytest
 from httpx import AsyncClient
 from litellm.exceptions import RateLimitError
 
+from model_server.encoders import _get_openai_client
 from model_server.encoders import CloudEmbedding
 from model_server.encoders import embed_text
 from model_server.encoders import local_rerank
@@ -30,6 +31,13 @@ async def mock_http_client() -> AsyncGenerator[AsyncMock, None]:
             yield c
 
 
+@pytest.fixture(autouse=True)
+def clear_openai_client_cache() -> None:
+    # OpenAI clients are cached per API key, drop them so patched clients
+    # don't leak between tests
+    _get_openai_client.cache_clear()
+
+
 @pytest.fixture
 def sample_embeddings() -> List[List[float]]:
     return [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
@@ -71,6 +79,112 @@ async def test_openai_embedding(
         mock_client.embeddings.create.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_openai_client_reused_across_embeddings(
+    sample_embeddings: List[List[float]],
+) -> None:
+    with patch("openai.AsyncOpenAI") as mock_openai:
+        mock_client = AsyncMock()
+        mock_openai.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.data = [MagicMock(embedding=emb) for emb in sample_embeddings]
+        mock_client.embeddings.create = AsyncMock(return_value=mock_response)
+
+        for _ in range(2):
+            async with CloudEmbedding(
+                "fake-key", EmbeddingProvider.OPENAI
+            ) as embedding:
+                await embedding._embed_openai(
+                    ["test1", "test2"], "text-embedding-ada-002", None
+                )
+        async with CloudEmbedding("other-key", EmbeddingProvider.OPENAI) as embedding:
+            await embedding._embed_openai(
+                ["test1", "test2"], "text-embedding-ada-002", None
+            )
+
+        # One client per API key, shared by every CloudEmbedding using that key
+        assert mock_openai.call_count == 2
+        assert [call.kwargs["api_key"] for call in mock_openai.call_args_list] == [
+            "fake-key",
+            "other-key",
+        ]
+        assert mock_client.embeddings.create.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_openai_embedding_batches_keep_order() -> None:
+    texts = [f"test{i}" for i in range(5)]
+
+    async def mock_create(input: list[str], **kwargs: Any) -> MagicMock:
+        # Later batches return first to make sure ordering doesn't depend on timing
+        await asyncio.sleep(0.01 * (len(texts) - int(input[0][4:])))
+        response = MagicMock()
+        response.data = [MagicMock(embedding=[float(text[4:])]) for text in input]
+        return response
+
+    with patch("openai.AsyncOpenAI") as mock_openai, patch(
+        "model_server.encoders._OPENAI_MAX_INPUT_LEN", 2
+    ):
+        mock_client = AsyncMock()
+        mock_openai.return_value = mock_client
+        mock_client.embeddings.create = AsyncMock(side_effect=mock_create)
+
+        embedding = CloudEmbedding("fake-key", EmbeddingProvider.OPENAI)
+        result = await embedding._embed_openai(texts, "text-embedding-ada-002", None)
+
+        assert result == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+        assert mock_client.embeddings.create.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_openai_embedding_failed_batch_cancels_pending_batches() -> None:
+    texts = [f"test{i}" for i in range(6)]
+
+    async def mock_create(input: list[str], **kwargs: Any) -> MagicMock:
+        if input[0] == "test0":
+            raise ValueError("bad request")
+        await asyncio.sleep(0.05)
+        response = MagicMock()
+        response.data = [MagicMock(embedding=[0.0]) for _ in input]
+        return response
+
+    with patch("openai.AsyncOpenAI") as mock_openai, patch(
+        "model_server.encoders._OPENAI_MAX_INPUT_LEN", 1
+    ), patch("model_server.encoders._OPENAI_MAX_CONCURRENT_BATCHES_PER_REQUEST", 1):
+        mock_client = AsyncMock()
+        mock_openai.return_value = mock_client
+        mock_client.embeddings.create = AsyncMock(side_effect=mock_create)
+
+        embedding = CloudEmbedding("fake-key", EmbeddingProvider.OPENAI)
+        with pytest.raises(ValueError):
+            await embedding._embed_openai(texts, "text-embedding-ada-002", None)
+
+        # Give any batch that wasn't cancelled a chance to run
+        await asyncio.sleep(0.2)
+
+        # The batch woken up by the failing batch releasing the semaphore may
+        # already have started, every other batch must have been cancelled
+        assert mock_client.embeddings.create.call_count <= 2
+
+
+@pytest.mark.asyncio
+async def test_openai_embedding_short_batch_response_raises() -> None:
+    with patch("openai.AsyncOpenAI") as mock_openai:
+        mock_client = AsyncMock()
+        mock_openai.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.data = [MagicMock(embedding=[0.1, 0.2])]
+        mock_client.embeddings.create = AsyncMock(return_value=mock_response)
+
+        embedding = CloudEmbedding("fake-key", EmbeddingProvider.OPENAI)
+        with pytest.raises(ValueError):
+            await embedding._embed_openai(
+                ["test1", "test2"], "text-embedding-ada-002", None
+            )
+
+
 @pytest.mark.asyncio
 async def test_embed_text_cloud_provider() -> None:
     with patch("model_server.encoders.CloudEmbedding.embed") as mock_embed:
@@ -0,0 +1,108 @@
+import time
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from onyx.onyxbot.slack import utils as slack_utils
+from onyx.onyxbot.slack.utils import get_sender_expert_info
+
+
+def _make_users_info_response(user_id: str, ok: bool = True) -> MagicMock:
+    response = MagicMock()
+    response.__getitem__.side_effect = {"ok": ok}.__getitem__
+    response.data = {
+        "user": {
+            "real_name": f"Real {user_id}",
+            "profile": {"email": f"{user_id}@example.com"},
+        }
+    }
+    return response
+
+
+def _make_web_client(ok: bool = True) -> MagicMock:
+    web_client = MagicMock()
+
+    def users_info(user: str, **kwargs: Any) -> MagicMock:
+        return _make_users_info_response(user, ok=ok)
+
+    web_client.users_info.side_effect = users_info
+    return web_client
+
+
+@pytest.fixture(autouse=True)
+def clear_sender_cache() -> Generator[None, None, None]:
+    slack_utils._sender_info_caches.clear()
+    yield
+    slack_utils._sender_info_caches.clear()
+
+
+def test_cache_hit_skips_users_info() -> None:
+    web_client = _make_web_client()
+
+    first = get_sender_expert_info("tenant", 1, "U1", web_client)
+    second = get_sender_expert_info("tenant", 1, "U1", web_client)
+
+    assert first is not None
+    assert first.email == "U1@example.com"
+    assert second == first
+    assert web_client.users_info.call_count == 1
+
+
+def test_missing_sender_skips_users_info() -> None:
+    web_client = _make_web_client()
+
+    assert get_sender_expert_info("tenant", 1, None, web_client) is None
+    web_client.users_info.assert_not_called()
+
+
+def test_failed_lookup_is_not_cached() -> None:
+    web_client = _make_web_client(ok=False)
+
+    assert get_sender_expert_info("tenant", 1, "U1", web_client) is None
+    assert get_sender_expert_info("tenant", 1, "U1", web_client) is None
+    assert web_client.users_info.call_count == 2
+
+
+def test_cache_expires_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    web_client = _make_web_client()
+
+    get_sender_expert_info("tenant", 1, "U1", web_client)
+    monkeypatch.setattr(
+        slack_utils,
+        "_sender_info_cache_start_time",
+        time.monotonic() - slack_utils._SENDER_CACHE_TTL_SECONDS - 1,
+    )
+    get_sender_expert_info("tenant", 1, "U1", web_client)
+
+    assert web_client.users_info.call_count == 2
+
+
+def test_cache_is_cleared_when_full(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(slack_utils, "_SENDER_CACHE_MAX_USERS_PER_BOT", 2)
+    web_client = _make_web_client()
+
+    get_sender_expert_info("tenant", 1, "U1", web_client)
+    get_sender_expert_info("tenant", 1, "U2", web_client)
+    # Cache is full, adding a third user drops the previous entries
+    get_sender_expert_info("tenant", 1, "U3", web_client)
+    get_sender_expert_info("tenant", 1, "U1", web_client)
+
+    assert web_client.users_info.call_count == 4
+    assert set(slack_utils._sender_info_caches[("tenant", 1)]) == {"U3", "U1"}
+
+
+def test_cache_is_isolated_per_tenant_and_bot() -> None:
+    web_client = _make_web_client()
+
+    get_sender_expert_info("tenant_a", 1, "U1", web_client)
+    get_sender_expert_info("tenant_a", 2, "U1", web_client)
+    get_sender_expert_info("tenant_b", 1, "U1", web_client)
+    assert web_client.users_info.call_count == 3
+
+    # Each (tenant, bot) pair now has its own entry
+    get_sender_expert_info("tenant_a", 1, "U1", web_client)
+    get_sender_expert_info("tenant_a", 2, "U1", web_client)
+    get_sender_expert_info("tenant_b", 1, "U1", web_client)
+    assert web_client.users_info.call_count == 3